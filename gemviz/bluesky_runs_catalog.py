@@ -12,13 +12,15 @@ MVC implementation of CatalogOfBlueskyRuns.
 import time
 from functools import partial
 
-import yaml
+import pyRestTable
+from PyQt5 import QtCore
 from PyQt5 import QtWidgets
 
 from . import utils
 
 PAGE_START = -1
 PAGE_SIZE = 10
+REFRESH_DELAY_MS = 150  # collect a burst of search changes into one refresh
 
 
 class BRC_MVC(QtWidgets.QWidget):
@@ -40,7 +42,6 @@ class BRC_MVC(QtWidgets.QWidget):
         from .bluesky_runs_catalog_run_viz import BRCRunVisualization
         from .bluesky_runs_catalog_search import BRCSearchPanel
         from .bluesky_runs_catalog_table_view import BRCTableView
-        from .user_settings import settings
 
         self.selected_run_uid = None
 
@@ -58,25 +59,32 @@ class BRC_MVC(QtWidgets.QWidget):
         layout.addWidget(self.brc_run_viz)
 
         # connect search signals with tableview update
-        widgets = [
-            [self.brc_search_panel.plan_name, "returnPressed"],
-            [self.brc_search_panel.scan_id, "returnPressed"],
-            [self.brc_search_panel.status, "returnPressed"],
-            [self.brc_search_panel.positioners, "returnPressed"],
-            [self.brc_search_panel.detectors, "returnPressed"],
-            [self.brc_search_panel.date_time_widget.apply, "released"],
+        # Each search change (re)starts the timer.  The (filtered) catalog is
+        # searched and the table view is updated once, after the last change.
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(REFRESH_DELAY_MS)
+        self.refresh_timer.timeout.connect(self.refreshFilteredCatalogView)
+        panel = self.brc_search_panel
+        signals = [
+            panel.plan_name.returnPressed,
+            panel.scan_id.returnPressed,
+            panel.status.returnPressed,
+            panel.positioners.returnPressed,
+            panel.detectors.returnPressed,
+            panel.date_time_widget.apply.released,
         ]
-        for widget, signal in widgets:
-            getattr(widget, signal).connect(self.refreshFilteredCatalogView)
+        for signal in signals:
+            signal.connect(self.refresh_timer.start)
 
         self.brc_tableview.run_selected.connect(self.doRunSelectedSlot)
 
         # save/restore splitter sizes in application settings
         for key in "hsplitter vsplitter".split():
             splitter = getattr(self, key)
-            sname = self.splitter_settings_name(key)
-            settings.restoreSplitter(splitter, sname)
             splitter.splitterMoved.connect(partial(self.splitter_moved, key))
+        # Restore after this widget is laid out and shown (next event loop pass).
+        QtCore.QTimer.singleShot(0, self.restoreSplitters)
 
     def catalog(self):
         return self.parent.catalog()
@@ -132,12 +140,9 @@ class BRC_MVC(QtWidgets.QWidget):
         run *object*:
             Instance of ``tapi.RunMetadata``
         """
-        from functools import partial
-
         from .select_stream_fields import SelectFieldsWidget
 
-        run_md = run.run_md
-        self.brc_run_viz.setMetadata(yaml.dump(dict(run_md), indent=4))
+        self.brc_run_viz.setRunMetadata(run.run_md)
         try:
             self.brc_run_viz.setData(self.getDataDescription(run))
         except (KeyError, ValueError) as exinfo:
@@ -156,8 +161,6 @@ class BRC_MVC(QtWidgets.QWidget):
 
     def getDataDescription(self, run):
         """Provide text description of the data streams in the run."""
-        import pyRestTable
-
         # Describe what will be plotted.  Show in the viz panel "Data" tab.
         analysis = run.plottable_signals()
         table = pyRestTable.Table()
@@ -170,26 +173,38 @@ class BRC_MVC(QtWidgets.QWidget):
             table.addRow(("plot axes", ", ".join(analysis["plot_axes"])))
             table.addRow(("all detectors", ", ".join(analysis["detectors"])))
             table.addRow(("all positioners", ", ".join(analysis["motors"])))
-        text = "plot summary"
-        text += "\n" + "-" * len(text) + "\n" * 2
-        text += f"{table.reST()}\n"
+        title = "plot summary"
+        lines = [title, "-" * len(title), "", table.reST()]
 
-        # Show information about each stream.
-        rows = []
+        # Show information about each stream.  Describe the data (shape and
+        # type of each field) without reading it.  The data of a stream are
+        # read when (& if) a field of that stream is plotted.
         for sname in run.stream_metadata():
             title = f"stream: {sname}"
-            # row = [title, "-" * len(title), str(run.stream_data(sname)), ""]
-            rows += [title, "-" * len(title), str(run.stream_data(sname)), ""]
-
-        text += "\n".join(rows).strip()
+            table = pyRestTable.Table()
+            table.labels = "field shape dtype".split()
+            for field, (shape, dtype) in run.stream_data_structure(sname).items():
+                table.addRow((field, shape, dtype))
+            lines += [title, "-" * len(title), table.reST().rstrip(), ""]
+
+        # Join all the text once, at the end.
+        text = "\n".join(lines).strip()
         return text
 
     def refreshFilteredCatalogView(self, *args, **kwargs):
         """Update the view with the new filtered catalog."""
-        # print(f"{__name__}.{__class__.__name__} {args=} {kwargs=}")
         filtered_catalog = self.brc_search_panel.filteredCatalog()
         self.brc_tableview.setCatalog(filtered_catalog)
 
+    def restoreSplitters(self):
+        """Restore the splitter sizes from the application settings."""
+        from .user_settings import settings
+
+        for key in "hsplitter vsplitter".split():
+            splitter = getattr(self, key)
+            sname = self.splitter_settings_name(key)
+            settings.restoreSplitter(splitter, sname)
+
     def splitter_moved(self, key, *arg, **kwargs):
         thread = getattr(self, f"{key}_wait_thread", None)
         setattr(self, f"{key}_deadline", time.time() + self.motion_wait_time)
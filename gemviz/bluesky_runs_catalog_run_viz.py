@@ -8,10 +8,16 @@ Visualize content of a Bluesky run.
     ~BRCRunVisualization
 """
 
+import yaml
 from PyQt5 import QtWidgets
 
 from . import utils
 
+try:  # the C (libyaml) emitter is much faster, when available
+    from yaml import CDumper as YamlDumper
+except ImportError:
+    from yaml import Dumper as YamlDumper
+
 
 class BRCRunVisualization(QtWidgets.QWidget):
     """The panel to show the contents of a run."""
@@ -27,11 +33,27 @@ class BRCRunVisualization(QtWidgets.QWidget):
         self.setup()
 
     def setup(self):
-        pass
+        self.run_md = None  # run metadata, not yet shown as text
+        self.tabWidget.currentChanged.connect(self.updateMetadata)
 
     def setMetadata(self, text, *args, **kwargs):
         self.metadata.setText(text)
 
+    def setRunMetadata(self, run_md):
+        """Show the run's metadata (as YAML) when the Metadata tab is shown."""
+        self.run_md = run_md
+        self.metadata.clear()
+        self.updateMetadata()
+
+    def updateMetadata(self, *args):
+        """Slot: Write the run's metadata as text, if shown now (& not done)."""
+        if self.run_md is None:
+            return
+        if self.tabWidget.currentWidget() is not self.metadataPage:
+            return  # Not needed now, maybe never.  Write it when shown.
+        run_md, self.run_md = self.run_md, None
+        self.setMetadata(yaml.dump(dict(run_md), Dumper=YamlDumper, indent=4))
+
     def setData(self, text, *args, **kwargs):
         self.data.setText(text)
 
@@ -6,6 +6,7 @@ BRC: BlueskyRunsCatalog
 
 import logging
 
+import tiled.queries
 from PyQt5 import QtWidgets
 
 from . import tapi
@@ -33,20 +34,19 @@ class BRCSearchPanel(QtWidgets.QWidget):
     def setupCatalog(self, catalog_name, *args, **kwargs):
         from .utils import DAY
 
-        def getStartTime(uid):
-            md = cat[uid].metadata
+        def getStartTime(run):
+            md = run.metadata
             ts = (md.get("start") or {}).get("time")
             return utils.ts2iso(ts)
 
         cat = self.catalog()
-        if len(cat) == 0:
+        # First and last runs, each with its metadata.  No need for len(cat).
+        first = tapi.get_tiled_slice(cat, 0, 1, items=True)
+        if len(first) == 0:
             self.setStatus(f"Catalog {catalog_name!r} has no runs.")
             return
-        keys = cat.keys()
-        start_times = [
-            getStartTime(keys.first()),
-            getStartTime(keys.last()),
-        ]
+        last = tapi.get_tiled_slice(cat, 0, 1, ascending=False, items=True)
+        start_times = [getStartTime(run) for _uid, run in first + last]
         t_low = min(start_times)
         t_high = max(start_times)
         t_high = utils.ts2iso(utils.iso2ts(t_high) + DAY)
@@ -57,37 +57,38 @@ class BRCSearchPanel(QtWidgets.QWidget):
         self.date_time_widget.setEnabled(permission)
 
     def filteredCatalog(self):
-        import tiled.queries
-
         cat = self.catalog()
 
         since = self.date_time_widget.low()
         until = self.date_time_widget.high()
-        cat = tapi.get_tiled_runs(cat, since=since, until=until)
         logger.debug("since=%s, until=%s", since, until)
 
+        # Collect the key filters, then search for all of them together.
+        keys = {}
         plan_name = self.plan_name.text().strip()
         if len(plan_name) > 0:
-            cat = tapi.get_tiled_runs(cat, plan_name=plan_name)
+            keys["plan_name"] = plan_name
 
         scan_id = self.scan_id.text().strip()
         if len(scan_id) > 0:
             try:
-                cat = tapi.get_tiled_runs(cat, scan_id=int(scan_id))
+                keys["scan_id"] = int(scan_id)
             except ValueError:
                 self.setStatus(
                     f"Invalid entry: scan_id must be an integer.  Received {scan_id=!r}"
                 )
 
-        motors = self.positioners.text().strip()
-        if len(motors) > 0:
-            for motor in motors.split(","):
-                cat = cat.search(tiled.queries.Contains("motors", motor.strip()))
-
-        detectors = self.detectors.text().strip()
-        if len(detectors) > 0:
-            for detector in detectors.split(","):
-                cat = cat.search(tiled.queries.Contains("detectors", detector.strip()))
+        cat = tapi.get_tiled_runs(cat, since=since, until=until, **keys)
+
+        for key, widget in (
+            ("motors", self.positioners),
+            ("detectors", self.detectors),
+        ):
+            # each (unique, non-empty) name in the comma-separated list
+            names = dict.fromkeys(name.strip() for name in widget.text().split(","))
+            for name in names:
+                if len(name) > 0:
+                    cat = cat.search(tiled.queries.Contains(key, name))
 
         # TODO: exit status filtering
 
@@ -6,8 +6,13 @@ BRC: BlueskyRunsCatalog
 .. autosummary::
 
     ~BRCTableModel
+    ~join_names
+    ~md_getter
+    ~names_getter
 """
 
+import functools
+import itertools
 import logging
 
 from PyQt5 import QtCore
@@ -23,35 +28,92 @@ BGCLUT = {  # BackGround Color Lookup Table
     # other, such as None (when no stop document)
     "other": QtGui.QColor(0xE2E2EC),  # light blue/grey
 }
+DATA_ROLES = (  # data() has nothing for any other role
+    QtCore.Qt.DisplayRole,
+    QtCore.Qt.BackgroundRole,
+    QtCore.Qt.TextAlignmentRole,
+)
+CENTERED_COLUMNS = ("Scan ID", "#points")  # other columns: align left
+FETCH_SIZE = 25  # fewest runs the model fetches at one time
+RUN_CACHE_SIZE = 1_000  # keep (at least) this many runs in each cache
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def join_names(names):
+    """Comma-separated text of the names (tuple).  Same text for same names."""
+    return ", ".join(names)
+
+
+def md_getter(doc, key):
+    """
+    Return a function(run) that gets this key from the run's document.
+
+    Same value as ``run.get_run_md(doc, key)``, with the document and key
+    bound once (per column), not passed for every cell.
+    """
+
+    def getter(run):
+        return (run.run_md.get(doc) or {}).get(key)
+
+    return getter
+
+
+def names_getter(doc, key):
+    """Return a function(run) that gets the text of this list of names."""
+    get = md_getter(doc, key)
+
+    def getter(run):
+        # Many runs have the same motors, detectors, or streams.
+        return join_names(tuple(get(run) or ()))
+
+    return getter
+
+
+_start_time = md_getter("start", "time")
+
+COLUMNS = (  # (label, action(run)) of each column in the table
+    ("Scan ID", md_getter("start", "scan_id")),
+    ("Plan Name", md_getter("start", "plan_name")),
+    ("Positioners", names_getter("start", "motors")),
+    ("Detectors", names_getter("start", "detectors")),
+    ("#points", md_getter("start", "num_points")),
+    ("Date", lambda run: utils.ts2iso(round(_start_time(run)))),
+    ("Status", md_getter("stop", "exit_status")),
+    ("Streams", names_getter("summary", "stream_names")),
+    # ("uid", md_getter("start", "uid")),
+    # ("uid7", lambda run: run.get_run_md("start", "uid")[:7]),
+)
+
+
 class BRCTableModel(QtCore.QAbstractTableModel):
     """Page of Bluesky catalog runs."""
 
     def __init__(self, parent):
         self.parent = parent  # QTableView
-        self.runs = {}
+        self.runs = {}  # runs fetched so far, keyed by uid
+        self.uids = ()  # all the runs (uids) on this page
+        self.run_loader = None  # function(uid), returns tapi.RunMetadata
+        self.fetch_size = FETCH_SIZE  # runs to fetch at one time
 
-        def get_str_list(run, doc, key):
-            return ", ".join(run.get_run_md(doc, key, []))
-
-        self.actions_library = {
-            "Scan ID": lambda run: run.get_run_md("start", "scan_id"),
-            "Plan Name": lambda run: run.get_run_md("start", "plan_name"),
-            "Positioners": lambda run: get_str_list(run, "start", "motors"),
-            "Detectors": lambda run: get_str_list(run, "start", "detectors"),
-            "#points": lambda run: run.get_run_md("start", "num_points"),
-            "Date": lambda run: utils.ts2iso(round(run.get_run_md("start", "time"))),
-            "Status": lambda run: run.get_run_md("stop", "exit_status"),
-            "Streams": lambda run: get_str_list(run, "summary", "stream_names"),
-            # "uid": lambda run: run.get_run_md("start", "uid"),
-            # "uid7": lambda run: run.get_run_md("start", "uid")[:7],
-        }
-        self.columnLabels = list(self.actions_library.keys())
+        self.columnLabels = tuple(label for label, _ in COLUMNS)
+        # data(): index the action (& alignment) by column number
+        self.columnActions = tuple(action for _, action in COLUMNS)
+        self.columnAlignments = tuple(
+            (
+                QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter
+                if label in CENTERED_COLUMNS
+                else QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+            )
+            for label in self.columnLabels
+        )
+        # for each column: the list of its values, by row
+        self.column_values = tuple([] for _ in self.columnActions)
+        self.row_backgrounds = []  # QBrush (or None) for each row
+        # by uid, for any page: (run, cell values, background) of the run's row
+        self.row_cache = {}
 
         super().__init__(parent)
-        # print(f"{__name__}: {data=}")
 
     # ------------ methods required by Qt's view
 
@@ -61,6 +123,47 @@ class BRCTableModel(QtCore.QAbstractTableModel):
         value = len(self.runs)
         return value
 
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        """Are there more runs on this page to fetch?  Called by QTableView."""
+        if parent.isValid():
+            return False  # table model: no children
+        return len(self.runs) < len(self.uids)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        """Fetch the next few runs on this page.  Called by QTableView."""
+        if parent.isValid():
+            return
+        first = len(self.runs)
+        end = min(first + self.fetch_size, len(self.uids))
+        if end <= first:
+            return
+        # Load first: if run_loader fails, the model has not been changed.
+        rows = self.loadRows(self.uids[first:end], self.run_loader)
+        self.beginInsertRows(QtCore.QModelIndex(), first, end - 1)
+        self.addRows(rows)
+        self.endInsertRows()
+
+    def loadRows(self, uids, run_loader):
+        """Load the runs of these uids.  Returns (uid, run, row) of each."""
+        rows = []
+        for uid in uids:
+            run = run_loader(uid)
+            rows.append((uid, run, self.runRow(uid, run)))
+        return rows
+
+    def addRows(self, rows):
+        """Append these rows (from ``loadRows()``) to the model."""
+        if len(rows) == 0:
+            return
+        uids, runs, row_values = zip(*rows)
+        self.runs.update(zip(uids, runs))
+
+        # Add these rows to each column at once, rather than cell by cell.
+        cells, backgrounds = zip(*row_values)
+        for values, new_values in zip(self.column_values, zip(*cells)):
+            values.extend(new_values)
+        self.row_backgrounds.extend(backgrounds)
+
     def columnCount(self, parent=None):
         """Return the number of columns. Called by QTableView."""
         # Want it to return the number of columns to be shown at a given time
@@ -69,28 +172,18 @@ class BRCTableModel(QtCore.QAbstractTableModel):
 
     def data(self, index, role=None):
         """Return the cell data. Called by QTableView."""
+        if role not in DATA_ROLES:
+            return None  # Qt asks about many roles, for every cell.
+
         if role == QtCore.Qt.DisplayRole:  # display data
-            row, column = index.row(), index.column()
-            label = self.columnLabels[column]
-            action = self.actions_library[label]
-            run = list(self.runs.values())[row]
-            result = action(run)
-            logger.debug("Display role: (%d, %d) %s", row, column, result)
-            # print(f"{__name__}: ({row}, {column}) {result}")
-            return result
+            # Called for every cell, each time it is painted.  Do not log here.
+            return self.column_values[index.column()][index.row()]
 
         elif role == QtCore.Qt.BackgroundRole:
-            run = list(self.runs.values())[index.row()]
-            exit_status = run.get_run_md("stop", "exit_status", "unknown")
-            bgcolor = BGCLUT.get(exit_status, BGCLUT["other"])
-            if bgcolor is not None:
-                return QtGui.QBrush(bgcolor)
+            return self.row_backgrounds[index.row()]
 
         elif role == QtCore.Qt.TextAlignmentRole:
-            if index.column() in [0, 4]:
-                return QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter
-            else:
-                return QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+            return self.columnAlignments[index.column()]
 
     def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
         """Return the column label. Called by QTableView."""
@@ -104,17 +197,83 @@ class BRCTableModel(QtCore.QAbstractTableModel):
 
     def getMetadata(self, index):
         """Return the selected run's metadata."""
-        return list(self.runs.values())[index]
+        return self.runs[self.uids[index]]
+
+    def runRow(self, uid, run):
+        """
+        Return (cell values, background) of the run's row.
 
-    def setRuns(self, runs):
+        The cells are computed once for each run, then kept (by uid) for
+        other pages.  They are computed again when the loader returns new
+        metadata for the run (such as an active run, still collecting data).
         """
-        Define the run (metadata) to be shown in the table now.
+        # pop & re-insert: dict order is least- to most-recently used
+        row = self.row_cache.pop(uid, None)
+        if row is None or row[0] is not run:
+            cells = tuple(action(run) for action in self.columnActions)
+            row = run, cells, self.runBackground(run)
+        self.row_cache[uid] = row
+        utils.trim_cache(self.row_cache, max(RUN_CACHE_SIZE, 2 * len(self.uids)))
+        return row[1:]
 
-        runs *dict(uid, metadata_dictionary)*:
-            Dictionary of run metadata, keyed by run uid.
+    def runBackground(self, run):
+        """Return the background (QBrush or None) for the run's row."""
+        exit_status = run.get_run_md("stop", "exit_status", "unknown")
+        bgcolor = BGCLUT.get(exit_status, BGCLUT["other"])
+        if bgcolor is not None:
+            return QtGui.QBrush(bgcolor)
+
+    def setUidList(self, uids, run_loader):
+        """
+        Define the runs to be shown in the table now.
+
+        The metadata of each run is fetched (using ``run_loader``) only when
+        the view needs that row.  The view asks for more rows (``fetchMore()``)
+        as the table is scrolled.
+
+        uids *(str)*:
+            Sequence of the uids of the runs on this page.
+        run_loader *function(uid)*:
+            Returns the ``tapi.RunMetadata`` of the run with this uid.
         """
-        self.runs = runs
-        self.layoutChanged.emit()  # Tell the view there is new data.
+        uids = tuple(uids)
+        # Rows shown now that the new page will fill again, in place.
+        rows = min(len(self.runs), len(uids), self.fetch_size)
+
+        if rows == 0:
+            # Reset (not re-layout) so the view drops selection & persistent
+            # indexes of the previous page before any new cells are requested.
+            self.beginResetModel()
+            self.uids = uids
+            self.run_loader = run_loader
+            self.runs = {}
+            self.column_values = tuple([] for _ in self.columnActions)
+            self.row_backgrounds = []
+            self.endResetModel()  # Tell the view there is new data.
+            self.fetchMore()  # The first rows will be shown now.
+            return
+
+        # Another page (next, back, ...) of the table: replace the cells of
+        # the first rows and tell the view which cells changed.  Qt keeps
+        # the geometry of these rows, no reset and layout of the whole table.
+        # Load first: if run_loader fails, the model has not been changed.
+        new_rows = self.loadRows(uids[:rows], run_loader)
+        if len(self.runs) > rows:
+            self.beginRemoveRows(QtCore.QModelIndex(), rows, len(self.runs) - 1)
+            self.runs = dict(itertools.islice(self.runs.items(), rows))
+            for values in self.column_values:
+                del values[rows:]
+            del self.row_backgrounds[rows:]
+            self.endRemoveRows()
+
+        self.uids = uids
+        self.run_loader = run_loader
+        self.runs = {}
+        self.column_values = tuple([] for _ in self.columnActions)
+        self.row_backgrounds = []
+        self.addRows(new_rows)
+        last = self.index(rows - 1, self.columnCount() - 1)
+        self.dataChanged.emit(self.index(0, 0), last)
 
 
 # -----------------------------------------------------------------------------
@@ -8,6 +8,9 @@ Uses :class:`bluesky_runs_catalog_table_model.BRCTableModel`.
 .. autosummary::
 
     ~BRCTableView
+    ~PageLoader
+    ~request_length
+    ~request_page_items
 """
 
 import logging
@@ -16,20 +19,100 @@ from functools import partial
 from PyQt5 import QtCore
 from PyQt5 import QtWidgets
 
+from . import tapi
 from . import utils
+from .bluesky_runs_catalog_table_model import FETCH_SIZE
+from .bluesky_runs_catalog_table_model import RUN_CACHE_SIZE
 
 logger = logging.getLogger(__name__)
+FETCH_LOOKAHEAD = 2  # fetch this many table heights of runs at one time
+PAGE_CACHE_SIZE = 8  # keep the runs of this many pages
+
+
+def request_length(size):
+    """Runs to request for a page: two pages, when one response holds both."""
+    return 2 * size if 2 * size <= tapi.MAX_PAGE_SIZE else size
+
+
+def request_page_items(cat, total, offset, size):
+    """
+    Request (uid, run) of the runs on this page from the server.
+
+    Return a dict of the pages received, keyed by (offset, length).
+
+    One bulk request gets the metadata of all runs on the page, rather
+    than one request for each run.  The same request gets the page the
+    user is likely to see next, when both pages fit in one response.
+
+    The server walks past ``offset`` runs to find a slice.  When the page
+    is in the second half of the catalog (such as the last page, shown
+    first), ask for the slice counted from the end of the catalog instead.
+    Then, the likely next page is the one before this page.  Counted from
+    the end, the page is right only while the catalog still has ``total``
+    runs.  If the count has changed (such as new runs), ask again, counted
+    from the start.
+    """
+    lookahead = request_length(size) - size  # the next page, or none
+    items = None
+    from_end = total - offset - size
+    if from_end < offset:
+        start = max(0, offset - lookahead)  # the previous page, then this page
+        items = tapi.get_tiled_slice(
+            cat, from_end, offset + size - start, ascending=False, items=True
+        )
+        # The client has the count from this same response, no new request.
+        if len(cat) == total:
+            items = tuple(reversed(items))
+            split = offset - start
+            page, other, other_offset = items[split:], items[:split], start
+        else:
+            items = None
+
+    if items is None:
+        end = min(total, offset + size + lookahead)  # this page, then the next
+        items = tapi.get_tiled_slice(cat, offset, end - offset, items=True)
+        page, other, other_offset = items[:size], items[size:], offset + size
+    pages = {(offset, size): page}
+    if len(other) > 0:
+        pages[(other_offset, len(other))] = other
+    return pages
+
+
+class PageLoader(QtCore.QRunnable):
+    """Request a page of runs in a worker thread.  Report with ``done()``."""
+
+    def __init__(self, done, cat, total, offset, size):
+        super().__init__()
+        # function(cat, key, result), result: (length, pages) or exception
+        self.done = done
+        self.cat = cat
+        self.total = total
+        self.key = offset, size
+
+    def run(self):
+        try:
+            pages = request_page_items(self.cat, self.total, *self.key)
+            # The client has the count from the same response, no new request.
+            result = len(self.cat), pages
+        except Exception as exc:  # report any failure, this thread has no caller
+            result = exc
+        self.done(self.cat, self.key, result)
 
 
 class BRCTableView(QtWidgets.QWidget):
     ui_file = utils.getUiFileName(__file__)
     run_selected = QtCore.pyqtSignal(object)
+    # (catalog, page key, result): emitted by a PageLoader, in its thread
+    page_loaded = QtCore.pyqtSignal(object, object, object)
 
     def __init__(self, parent, catalog, page_offset, page_size):
         self.parent = parent
-        self._catalog = catalog
-        self._catalog_length = len(catalog)
+        self.page_cache = {}  # by (offset, length): (uid, run) items of a page
         self.run_cache = {}
+        self.page_runs = {}  # tiled client of each run on this page, by uid
+        self._columns_sized = False  # column widths fitted to the first page?
+        self._page_shown = None  # (offset, size) of the page in the model
+        self.loadCatalog(catalog, int(page_size))
 
         super().__init__(parent)
         utils.myLoadUi(self.ui_file, baseinstance=self)
@@ -41,10 +124,18 @@ class BRCTableView(QtWidgets.QWidget):
 
         self.model = BRCTableModel(self)
         self.tableView.setModel(self.model)
+        self.page_loaded.connect(self.pageLoaded)
 
         # since we cannot set header's ResizeMode in Designer ...
+        # ResizeToContents would measure every cell after each model reset.
+        # Fit the columns once (see updateModelData()), then let the user adjust.
         header = self.tableView.horizontalHeader()
-        header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        # Measure only a few rows when fitting the columns.  Long text
+        # (such as the detectors list) is shown on one line, elided.
+        header.setResizeContentsPrecision(20)
+        self.tableView.setWordWrap(False)
+        self.tableView.setTextElideMode(QtCore.Qt.ElideRight)
 
         if self.pageSize.findText(str(page_size)) == -1:
             self.pageSize.insertItem(0, str(page_size))
@@ -59,12 +150,9 @@ class BRCTableView(QtWidgets.QWidget):
             # custom: pass the button name to the receiver
             button.released.connect(partial(self.doPagerButtons, button_name))
 
-        self.parent.brc_search_panel.enableDateRange(
-            len(self.parent.brc_search_panel.catalog()) > 0
-        )
+        # same catalog as the search panel's, its length is known
+        self.parent.brc_search_panel.enableDateRange(self.catalogLength() > 0)
 
-        self.setButtonPermissions()
-        self.setPagerStatus()
         self.tableView.clicked.connect(self.doRunSelectedSlot)
 
     def doPagerButtons(self, action, **kwargs):
@@ -82,19 +170,15 @@ class BRCTableView(QtWidgets.QWidget):
         elif action == "last":
             self.setPage(-1, self.page_size)
 
-        self.setButtonPermissions()
-        self.setPagerStatus()
-
     @property
     def pagerAtStart(self):
         """Is this the first page?"""
-        return self.page_offset == 0
+        return self.pager_at_start
 
     @property
     def pagerAtEnd(self):
         """Is this the last page?"""
-        # number is zero-based
-        return (self.page_offset + self.page_size) >= self.catalogLength()
+        return self.pager_at_end
 
     def setButtonPermissions(self):
         """Enable/disable the pager buttons, depending on page in view."""
@@ -112,14 +196,24 @@ class BRCTableView(QtWidgets.QWidget):
         offset = int(offset)
         size = int(size)
 
-        self.page_size = max(0, min(size, self.catalogLength()))
+        # Keep the page size the user chose, even if the catalog is smaller.
+        # The last page is the last 'size' runs, so compare with 'last_offset'.
+        self.page_size = max(0, size)
+        last_offset = max(0, self.catalogLength() - self.page_size)
         if offset >= 0:
-            offset = min(offset, self.catalogLength() - self.page_size)
+            offset = min(offset, last_offset)
         else:
-            offset = self.catalogLength() - self.page_size
+            offset = last_offset
         self.page_offset = max(0, offset)
+        # Known here, once for each page: no need to compute for each button.
+        self.pager_at_start = self.page_offset == 0
+        self.pager_at_end = self.page_offset >= last_offset
+        self.setButtonPermissions()
         if int(self.pageSize.currentText()) != self.page_size:
-            self.pageSize.setCurrentText(str(self.page_size))
+            # Only show the size.  Do not signal doPagerButtons("pageSize"),
+            # that would reset the model again (for the same page).
+            with QtCore.QSignalBlocker(self.pageSize):
+                self.pageSize.setCurrentText(str(self.page_size))
         logger.debug(
             "len(catalog)=%d  offset=%d  size=%d",
             self.catalogLength(),
@@ -131,28 +225,109 @@ class BRCTableView(QtWidgets.QWidget):
         # see: https://stackoverflow.com/questions/64225673
         # "how-to-deselect-an-entire-qtablewidget-row"
 
-        self.updateModelData()
+        # Such as "back" on the first page: the same runs, no new query.
+        page = self.page_offset, self.page_size
+        if page != self._page_shown:
+            self.updateModelData()
+            self._page_shown = page
 
     def updateModelData(self):
-        """Send a new page of runs to the model."""
-        from . import tapi
-
-        # get list of metadata for each run to be shown in the table
-        start = self.page_offset
-        end = self.page_offset + self.page_size
-        uid_list = self.catalog().keys()[start:end]
-
-        page = {}  # the new page of run metadata
-        for uid in uid_list:
-            run_md = self.run_cache.get(uid)
-            if run_md is None or run_md.active:
-                # Get new information from the server about this run.
-                run_md = tapi.RunMetadata(self.catalog(), uid)
-                self.run_cache[uid] = run_md  # update the cache
-            page[uid] = run_md
-
-        # Send the page of runs to the model now.
-        self.model.setRuns(page)
+        """
+        Send a new page of runs to the model.
+
+        Pages recently shown (or requested with them) are kept, so paging
+        back and forth does not ask the server again.  Other pages are
+        requested in a worker thread, so the window stays responsive.
+        """
+        key = self.page_offset, self.pageLength()
+        # pop & re-insert: dict order is least- to most-recently used
+        items = self.page_cache.pop(key, None)
+        if items is None and key[1] == 0:
+            items = ()  # No runs: nothing to request.
+        if items is None:
+            self.showPage(())  # Until the runs of this page arrive.
+            # The pager shows this page's runs when they are shown.
+            self.setPagerStatus("Requesting runs from the server ...")
+            loader = PageLoader(
+                self.page_loaded.emit, self.catalog(), self._catalog_length, *key
+            )
+            QtCore.QThreadPool.globalInstance().start(loader)
+        else:
+            self.cachePages({key: items})
+            self.showPage(items)
+            self.setPagerStatus()
+
+    def pageLoaded(self, catalog, key, result):
+        """Slot: a PageLoader received a page (or failed)."""
+        if catalog is not self.catalog():
+            return  # The catalog was changed (filtered) meanwhile.
+        current = key == (self.page_offset, self.pageLength())
+        if isinstance(result, Exception):
+            if current:
+                self._page_shown = None  # Request it again next time.
+                self.status.setText("No runs shown")  # not the page's range
+                self.setStatus(str(result))
+            return
+        length, pages = result
+        if length != self._catalog_length:
+            # Runs were added (or removed) since the catalog was loaded.  The
+            # pages kept may no longer be the runs at their offsets.
+            self.page_cache = {}
+        self.cachePages(pages)
+        if current:
+            self.showPage(pages[key])
+            self.setPagerStatus()
+
+    def cachePages(self, pages):
+        """Keep these pages (dict keyed by (offset, length)), most recent last."""
+        self.page_cache.update(pages)
+        utils.trim_cache(self.page_cache, PAGE_CACHE_SIZE)
+
+    def showPage(self, items):
+        """Show these (uid, run) items in the table."""
+        self.page_runs = dict(items)
+        # A selected row (or scroll position) belongs to the previous page.
+        self.tableView.clearSelection()
+        self.tableView.scrollToTop()
+
+        # Send the page of runs to the model now.  The model gets the
+        # metadata of each run (from the cache) only as rows are shown.
+        self.model.fetch_size = self.fetchSize()
+        self.model.setUidList(tuple(self.page_runs), self.getRunMetadata)
+
+        if not self._columns_sized and self.model.rowCount() > 0:
+            header = self.tableView.horizontalHeader()
+            header.resizeSections(QtWidgets.QHeaderView.ResizeToContents)
+            self._columns_sized = True
+
+    def pageLength(self):
+        """Number of runs on this page (the last page may not be full)."""
+        return max(0, min(self.page_size, self.catalogLength() - self.page_offset))
+
+    def fetchSize(self):
+        """Number of runs to fetch at one time: fill the table, and more."""
+        row_height = max(1, self.tableView.verticalHeader().defaultSectionSize())
+        visible_rows = self.tableView.viewport().height() // row_height
+        return max(FETCH_SIZE, FETCH_LOOKAHEAD * visible_rows)
+
+    def getRunMetadata(self, uid):
+        """Return the run's metadata, from the cache when possible."""
+        # pop & re-insert: dict order is least- to most-recently used
+        run_md = self.run_cache.pop(uid, None)
+        if run_md is None:
+            # Use the run received with this page, else ask the server.
+            run = self.page_runs.get(uid)
+            run_md = tapi.RunMetadata(
+                self.catalog(), uid, run=run, last_uid=self.last_uid
+            )
+        elif run_md.active:
+            # Get new information from the server about this run.
+            run_md = tapi.RunMetadata(self.catalog(), uid)
+        self.run_cache[uid] = run_md  # update the cache
+
+        # Keep the cache bounded, but never smaller than a page.
+        utils.trim_cache(self.run_cache, max(RUN_CACHE_SIZE, 2 * self.page_size))
+        return run_md
 
     def setPagerStatus(self, text=None):
         if text is None:
@@ -161,27 +336,58 @@ class BRCTableView(QtWidgets.QWidget):
                 text = "No runs"
             else:
                 start = self.page_offset
-                end = start + self.page_size
+                end = start + self.pageLength()
                 text = f"{start + 1}-{end} of {total} runs"
 
         self.status.setText(text)
         self.setStatus(text)
 
     def doRunSelectedSlot(self, index):
-        run_md = list(self.model.runs.values())[index.row()]
+        run_md = self.model.getMetadata(index.row())
         self.run_selected.emit(run_md)
 
+    def loadCatalog(self, catalog, page_size):
+        """
+        Use this catalog.  Request its last pages and its length together.
+
+        The last page is shown first.  Request it (and the page before it,
+        likely next, when both fit in one response) without knowing the
+        catalog's length.  The response
+        includes the length.  The tiled client keeps that value briefly, so
+        ``len(catalog)`` does not make another request to the server.
+        """
+        self._catalog = catalog
+        self._page_shown = None  # new catalog: always update the model
+        self.page_cache = {}
+        try:
+            items = tapi.get_tiled_slice(
+                catalog, 0, request_length(page_size), ascending=False, items=True
+            )
+        except tapi.TiledServerError:
+            items = ()  # Report the error when the page is requested.
+        self._catalog_length = total = len(catalog)
+        # Only the last run can be active.  Knowing its uid, a run without
+        # a stop document needs no request to learn if it is the last one.
+        self.last_uid = items[0][0] if len(items) > 0 else None
+
+        items = tuple(reversed(items))  # catalog order
+        n = len(items)
+        size = min(page_size, n)  # same as pageLength() of the last page
+        if size > 0 and total >= n:
+            # keys match updateModelData(): (page_offset, pageLength())
+            self.page_cache[(total - size, size)] = items[-size:]
+            if n > size:
+                self.page_cache[(total - n, n - size)] = items[:-size]
+
     def setCatalog(self, catalog):
-        self._catalog = catalog  # filtered catalog
-        self._catalog_length = len(catalog)
+        self.loadCatalog(catalog, self.page_size)  # filtered catalog
 
         uid = self.parent.selected_run_uid
-        if uid in self.model.runs:
-            offset = list(self.model.runs.keys()).index(uid)
+        if uid in self.model.uids:
+            offset = self.model.uids.index(uid)
         else:
             offset = -1
         self.setPage(offset, self.page_size)  # ... and update the model
-        self.setPagerStatus()
 
     def catalog(self):
         return self._catalog
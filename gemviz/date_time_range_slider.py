@@ -90,8 +90,11 @@ class DateTimeRangeSlider(QtWidgets.QWidget):
         """
         if not self._locked:
             self._locked = True
-            self.setLow(utils.ts2iso(self._timestamp_units(low)))
-            self.setHigh(utils.ts2iso(self._timestamp_units(high)))
+            # Usually, only one handle moved.  Convert & set only its date.
+            if low != self._slider_units(self._low):
+                self.setLow(utils.ts2iso(self._timestamp_units(low)))
+            if high != self._slider_units(self._high):
+                self.setHigh(utils.ts2iso(self._timestamp_units(high)))
             self._locked = False
 
     def adjustSlider(self, *args):
@@ -5,16 +5,17 @@ gemviz main window
 # TODO: remove testing URLs before production
 
 import logging
+import re
 
 from PyQt5 import QtCore
 from PyQt5 import QtWidgets
 
 from . import APP_TITLE
-from . import tapi
 from . import utils
 from .tiledserverdialog import LOCALHOST_URL
 from .tiledserverdialog import TESTING_URL
 from .tiledserverdialog import TILED_SERVER_SETTINGS_KEY
+from .tiledserverdialog import getRecentServers
 from .user_settings import settings
 
 TESTING_URLS = [TESTING_URL, LOCALHOST_URL]
@@ -23,6 +24,8 @@ UI_FILE = utils.getUiFileName(__file__)
 SORT_ASCENDING = 1
 SORT_DESCENDING = -SORT_ASCENDING
 SORT_DIRECTION = SORT_ASCENDING
+# absolute http(s) URI of a tiled server, such as "http://localhost:8020"
+SERVER_URI_PATTERN = re.compile(r"^https?://[^\s/$.?#][^\s]*$", re.IGNORECASE)
 logger = logging.getLogger(__name__)
 
 
@@ -152,15 +155,19 @@ class MainWindow(QtWidgets.QMainWindow):
         Only add catalogs of CatalogOfBlueskyRuns.
         """
         self.catalogs.clear()
+        names = []
         for catalog_name in catalogs:
             try:
                 spec = self.server()[catalog_name].specs[0]
                 if spec.name == "CatalogOfBlueskyRuns" and spec.version == "1":
-                    self.catalogs.addItem(catalog_name)
+                    names.append(catalog_name)
             except Exception as exc:
                 message = f"Problem with catalog {catalog_name}: {exc}"
                 logger.debug(message)
                 self.setStatus(message)
+        # All at once: the first name is selected (and its catalog shown)
+        # after the list is complete.
+        self.catalogs.addItems(names)
 
     def clearContent(self, clear_cat=True):
         layout = self.groupbox.layout()
@@ -173,8 +180,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def setServerList(self, selected_uri=None):
         """Rebuild the list of server URIs."""
-        recent_uris_str = settings.getKey(TILED_SERVER_SETTINGS_KEY)
-        recent_uris_list = recent_uris_str.split(",") if recent_uris_str else []
+        recent_uris_list = getRecentServers()
         if selected_uri and self.isValidServerUri(selected_uri):
             final_uri_list = [selected_uri] + [
                 uri
@@ -210,6 +216,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.setStatus("No tiled server selected.")
                 return
             self.setStatus(f"selected tiled {server_uri=!r}")
+            # tiled (& httpx) are imported here, when first connecting.
+            from . import tapi
+
             try:
                 client = tapi.connect_tiled_server(server_uri)
             except Exception as exc:
@@ -219,8 +228,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def isValidServerUri(self, server_uri):
         """Check if the server URI is valid and absolute."""
-        url = QtCore.QUrl(server_uri)
-        return url.isValid() and not url.isRelative()
+        return SERVER_URI_PATTERN.match(server_uri or "") is not None
 
     def server(self):
         return self._server
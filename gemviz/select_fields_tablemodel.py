@@ -147,11 +147,11 @@ class SelectFieldsTableModel(QtCore.QAbstractTableModel):
 
     def rowCount(self, parent=None):
         """Number of fields."""
-        return len(self.fields())
+        return len(self._field_names)
 
     def columnCount(self, parent=None):
         """Number of columns."""
-        return len(self.columns())
+        return len(self._column_names)
 
     def data(self, index, role=None):
         """Table data.  Called by QTableView."""
@@ -190,8 +190,8 @@ class SelectFieldsTableModel(QtCore.QAbstractTableModel):
 
     def checkbox(self, index):
         """Return the checkbox state."""
-        nm = self.columnName(index.column())  # selection name of THIS column
-        selection = self.selections().get(index.row())  # user selection
+        nm = self._column_names[index.column()]  # selection name of THIS column
+        selection = self._selections.get(index.row())  # user selection
         return QtCore.Qt.Checked if selection == nm else QtCore.Qt.Unchecked
 
     def setCheckbox(self, index, state):
@@ -209,8 +209,10 @@ class SelectFieldsTableModel(QtCore.QAbstractTableModel):
         if changes:
             self.updateCheckboxes()
 
-        self.logCheckboxSelections()
-        logger.debug(self.plotFields())  # plotter should call plotFields()
+        if logger.isEnabledFor(logging.DEBUG):
+            # These walk every row.  Only when the text will be logged.
+            self.logCheckboxSelections()
+            logger.debug(self.plotFields())  # plotter should call plotFields()
 
     def applySelectionRules(self, index, changes=False):
         """Apply selection rules 2-4."""
@@ -255,10 +257,10 @@ class SelectFieldsTableModel(QtCore.QAbstractTableModel):
     # ------------ local methods
 
     def columnName(self, column: int):
-        return self.columns()[column]
+        return self._column_names[column]
 
     def columnNumber(self, column_name):
-        return self.columns().index(column_name)
+        return self._column_names.index(column_name)
 
     def columns(self):
         return list(self._columns)  # return list(str)
@@ -269,6 +271,8 @@ class SelectFieldsTableModel(QtCore.QAbstractTableModel):
             raise RuntimeError("Once defined, cannot change columns.")
 
         self._columns = {column.name: column for column in columns}
+        # Called for every cell: index the names directly, without a new list.
+        self._column_names = tuple(self._columns)
         # NOTE: list(int), not list(str): column _number_ (not column name)
         self.checkboxColumns = [
             column_number
@@ -294,17 +298,17 @@ class SelectFieldsTableModel(QtCore.QAbstractTableModel):
         ]
 
     def fieldName(self, row):
-        return self.fields()[row]
+        return self._field_names[row]
 
     def fieldText(self, index):
         row, column = index.row(), index.column()
         assert column in self.textColumns, f"{column=} is not text"
 
-        fname = self.fieldName(row)
+        fname = self._field_names[row]
         if column == 0:
             return fname  # special case
 
-        cname = self.columnName(column)
+        cname = self._column_names[column]
         text = str(getattr(self._fields[fname], cname.lower(), ""))
         return text
 
@@ -317,6 +321,7 @@ class SelectFieldsTableModel(QtCore.QAbstractTableModel):
         if self._fields_locked:
             raise RuntimeError("Once defined, cannot change fields.")
         self._fields = {field.name: field for field in fields}
+        self._field_names = tuple(self._fields)
 
         # Pre-select fields with columns, where fields is list(Field).
         for row, field in enumerate(fields):
@@ -8,6 +8,8 @@ Uses :class:`select_fields_tablemodel.SelectFieldsTableModel`.
     ~SelectFieldsTableView
 """
 
+from functools import partial
+
 from PyQt5 import QtCore
 from PyQt5 import QtWidgets
 
@@ -25,11 +27,11 @@ class SelectFieldsTableView(QtWidgets.QWidget):
         self.setup()
 
     def setup(self):
-        from functools import partial
-
         # since we cannot set header's ResizeMode in Designer ...
+        # ResizeToContents would measure every row again after each change,
+        # such as a checkbox click.  Fit the columns to each new model instead.
         header = self.tableView.horizontalHeader()
-        header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
 
         self.addButton.clicked.connect(partial(self.responder, "add"))
         self.removeButton.clicked.connect(partial(self.responder, "remove"))
@@ -41,6 +43,9 @@ class SelectFieldsTableView(QtWidgets.QWidget):
         data_model = SelectFieldsTableModel(columns, fields)
         self.tableView.setModel(data_model)
 
+        header = self.tableView.horizontalHeader()
+        header.resizeSections(QtWidgets.QHeaderView.ResizeToContents)
+
     def responder(self, action):
         """Modify the plot with the described action."""
         self.selected.emit(action, self.tableView.model().plotFields())
@@ -7,7 +7,6 @@ QWidget to select stream data fields for plotting.
     ~to_datasets
 """
 
-import datetime
 import logging
 
 import xarray
@@ -51,6 +50,13 @@ class SelectFieldsWidget(QtWidgets.QWidget):
     def setup(self):
         self.run_summary.setText(self.run.summary())
 
+        # One view of the fields, for all streams.  setStream() changes its model.
+        self.fields_view = SelectFieldsTableView(self)
+        self.fields_view.selected.connect(self.relayPlotSelections)
+        layout = self.groupbox.layout()
+        utils.removeAllLayoutWidgets(layout)
+        layout.addWidget(self.fields_view)
+
         stream_list = list(self.run.stream_metadata())
         if "baseline" in stream_list:
             # Too many signals! 2 points each.  Do not plot from "baseline" stream.
@@ -68,18 +74,14 @@ class SelectFieldsWidget(QtWidgets.QWidget):
             self.streams.currentTextChanged.connect(self.setStream)
 
     def setStream(self, stream_name):
-        from functools import partial
-
         self.stream_name = stream_name
-        stream = self.run.run[stream_name]
-        logger.debug("stream_name=%s, stream=%s", stream_name, stream)
+        logger.debug("stream_name=%s", stream_name)
 
         x_names = self.analysis["plot_axes"]
         y_name = self.analysis["plot_signal"]
 
         # describe the data fields for the dialog.
         sdf = self.run.stream_data_fields(stream_name)
-        # print(f"{__name__}.{__class__.__name__}: {sdf=}")
         fields = []
         for field_name in sdf:
             selection = None
@@ -89,7 +91,6 @@ class SelectFieldsWidget(QtWidgets.QWidget):
                 selection = "Y"
             shape = self.run.stream_data_field_shape(stream_name, field_name)
             if len(shape) == 0:
-                # print(f"{stream_name=} {field_name=} {shape=}")
                 logger.debug(
                     "stream_name=%s field_name=%s shape=%s",
                     stream_name,
@@ -100,19 +101,13 @@ class SelectFieldsWidget(QtWidgets.QWidget):
             fields.append(field)
         logger.debug("fields=%s", fields)
 
-        # build the view of this stream
-        view = SelectFieldsTableView(self)
-        view.displayTable(STREAM_COLUMNS, fields)
-        view.selected.connect(partial(self.relayPlotSelections, stream_name))
-
-        layout = self.groupbox.layout()
-        utils.removeAllLayoutWidgets(layout)
-        layout.addWidget(view)
+        # show this stream in the (existing) view
+        self.fields_view.displayTable(STREAM_COLUMNS, fields)
 
-    def relayPlotSelections(self, stream_name, action, selections):
+    def relayPlotSelections(self, action, selections):
         """Receive selections from the dialog and relay to the caller."""
-        # selections["stream_name"] = self.stream_name
-        self.selected.emit(stream_name, action, selections)
+        # selections are from the stream shown now
+        self.selected.emit(self.stream_name, action, selections)
 
 
 def to_datasets(run, stream_name, selections, scan_id=None):
@@ -138,11 +133,11 @@ def to_datasets(run, stream_name, selections, scan_id=None):
                 f" {x_axis} shape is {x_shape}"
             )
             # fmt: on
-        if x_axis == "time" and min(x_data) > chartview.TIMESTAMP_LIMIT:
+        if x_axis == "time" and x_data.min() > chartview.TIMESTAMP_LIMIT:
             x_units = ""
             x_datetime = True
             x_data = xarray.DataArray(
-                data=list(map(datetime.datetime.fromtimestamp, x_data[x_axis].data)),
+                data=utils.ts2dt64(x_data[x_axis].data),
                 name=x_axis,
                 # dims=x_axis,
                 # coords=?,
@@ -5,6 +5,7 @@ TAPI: Local support for the tiled API & data structures.
 
     ~connect_tiled_server
     ~get_tiled_runs
+    ~get_tiled_slice
     ~QueryTimeSince
     ~QueryTimeUntil
     ~RunMetadata
@@ -17,7 +18,10 @@ import tiled
 import tiled.queries
 from httpx import HTTPStatusError
 
+from . import utils
+
 logger = logging.getLogger(__name__)
+MAX_PAGE_SIZE = 300  # most items the tiled server sends in one response
 
 
 class TiledServerError(RuntimeError):
@@ -27,10 +31,23 @@ class TiledServerError(RuntimeError):
 class RunMetadata:
     """Cache the metadata for a single run."""
 
-    def __init__(self, cat, uid):
+    # Many of these are kept (one per run in the table), no __dict__ for each.
+    __slots__ = (
+        "active",
+        "catalog",
+        "plottable",
+        "run",
+        "run_md",
+        "streams_data",
+        "streams_md",
+        "streams_structure",
+        "uid",
+    )
+
+    def __init__(self, cat, uid, run=None, last_uid=None):
         self.catalog = cat
         self.uid = uid
-        self.request_from_tiled_server()
+        self.request_from_tiled_server(run, last_uid)
 
     def __str__(self) -> str:
         return (
@@ -39,15 +56,26 @@ class RunMetadata:
             f" active={self.active})"
         )
 
-    def request_from_tiled_server(self):
-        """Get run details from server."""
-        self.run = self.catalog[self.uid]
+    def request_from_tiled_server(self, run=None, last_uid=None):
+        """
+        Get run details from server (unless given the run, just received).
+
+        ``last_uid`` is the catalog's last uid, when the caller knows it.
+        """
+        self.run = self.catalog[self.uid] if run is None else run
         self.run_md = self.run.metadata
-        self.active = (
-            self.uid == self.catalog.keys().last() and "stop" not in self.run_md
-        )
+        # Test for "stop" first: asking for the catalog's last key is a
+        # request to the server, only needed when there is no stop document.
+        if "stop" in self.run_md:
+            self.active = False
+        else:
+            if last_uid is None:
+                last_uid = self.catalog.keys().last()
+            self.active = self.uid == last_uid
         self.streams_md = None
-        self.streams_data = None
+        self.streams_data = {}  # read only the streams asked for
+        self.streams_structure = {}
+        self.plottable = None  # cache for plottable_signals()
 
     def get_run_md(self, doc, key, default=None):
         """Get metadata by key from run document."""
@@ -69,6 +97,8 @@ class RunMetadata:
         * The stream descriptor list is usually length = 1.
         * object_keys are used to get lists of data_keys (fields)
         """
+        if self.plottable is not None:
+            return self.plottable  # Selecting a run asks more than once.
 
         def find_name_device_or_signal(key):
             if key in stream_hints:  # from ophyd.Device
@@ -88,8 +118,8 @@ class RunMetadata:
         def is_numeric(signal):
             dtype = descriptor["data_keys"][signal]["dtype"]
             if dtype == "array":
-                stream_data = self.stream_data(self.stream_name)
-                ntype = stream_data["data"][signal].dtype.name
+                # Only the data type is needed here, not the data.
+                ntype = self.stream_data_structure(stream)[signal][1].name
                 if ntype.startswith("int") or ntype.startswith("float"):
                     dtype = "number"
             return dtype == "number"
@@ -165,7 +195,7 @@ class RunMetadata:
                     plot_signal = field
                     break
 
-        return {
+        self.plottable = {
             "catalog": self.catalog.item["id"],
             "uid": self.uid,
             "stream": stream,
@@ -175,16 +205,31 @@ class RunMetadata:
             "detectors": detectors,
             "fields": fields,
         }
+        return self.plottable
 
     def stream_data(self, stream_name):
         """Return the data structure for this stream."""
-        if self.streams_data is None:
-            # Optimize with a cache.
-            self.streams_data = {
-                sname: self.run[sname]["data"].read() for sname in self.run
-            }
+        data = self.streams_data.get(stream_name)
+        if data is None:
+            # Optimize with a cache.  Read just this stream, not every stream.
+            data = self.run[stream_name]["data"].read()
+            self.streams_data[stream_name] = data
+        return data
+
+    def stream_data_structure(self, stream_name):
+        """
+        Return the (shape, dtype) of each data field in this stream.
 
-        return self.streams_data[stream_name]
+        The server describes each field's array, the data are not read.
+        """
+        structure = self.streams_structure.get(stream_name)
+        if structure is None:
+            structure = {
+                field: (array.shape, array.dtype)
+                for field, array in self.run[stream_name]["data"].items()
+            }
+            self.streams_structure[stream_name] = structure
+        return structure
 
     def stream_data_field_shape(self, stream_name, field_name):
         """Shape of this data field."""
@@ -215,33 +260,33 @@ class RunMetadata:
 
     def stream_data_field_pv(self, stream_name, field_name):
         """EPICS PV name of this field."""
-        pv = ""
-        try:
-            descriptors = self.stream_metadata(stream_name).get("descriptors", {})
-            assert len(descriptors) == 1, f"{stream_name=} has {len(descriptors)=}"
-            source = descriptors[0]["data_keys"][field_name].get("source", "")
-            if source.startswith("PV:"):
-                pv = source[3:]
-        except Exception:
-            pass
-        return pv
+        source = self.stream_data_key(stream_name, field_name).get("source") or ""
+        if isinstance(source, str) and source.startswith("PV:"):
+            return source[3:]
+        return ""
 
     def stream_data_field_units(self, stream_name, field_name):
         """Engineering units of this field."""
-        units = ""
+        return self.stream_data_key(stream_name, field_name).get("units", "")
+
+    def stream_data_key(self, stream_name, field_name):
+        """Description (dict) of this field in the stream's descriptor."""
         try:
             descriptors = self.stream_metadata(stream_name).get("descriptors", {})
             assert len(descriptors) == 1, f"{stream_name=} has {len(descriptors)=}"
-            units = descriptors[0]["data_keys"][field_name].get("units", "")
+            return descriptors[0]["data_keys"][field_name]
         except Exception:
-            pass
-        return units
+            return {}
 
     def stream_metadata(self, stream_name=None):
         """Return the metadata dictionary for this stream."""
         if self.streams_md is None:
-            # Optimize with a cache.
-            self.streams_md = {sname: self.run[sname].metadata for sname in self.run}
+            # Optimize with a cache.  Walk the run's streams as (name, stream)
+            # items: the server sends the metadata of all streams together,
+            # rather than one request for each stream.
+            self.streams_md = {
+                sname: stream.metadata for sname, stream in self.run.items()
+            }
 
         if stream_name is None:
             return self.streams_md
@@ -267,12 +312,32 @@ def connect_tiled_server(uri):
     return client
 
 
-def get_tiled_slice(cat, offset, size, ascending=True):
-    end = offset + size
-    key_gen = cat.keys()
+def get_tiled_slice(cat, offset, size, ascending=True, items=False):
+    """
+    Return a tuple with (at most) ``size`` uids, starting at ``offset``.
+
+    Only this slice is requested from the server, never the full list.
+    With ``ascending=False``, ``offset`` counts from the end of the catalog.
+    With ``items=True``, return ``(uid, run)`` pairs instead.  The server
+    sends the metadata of all these runs in the same (bulk) request.
+    The server sends at most ``MAX_PAGE_SIZE`` items in one response, so
+    a larger slice is requested in parts.
+    """
+    key_gen = cat.items() if items else cat.keys()
 
+    result = ()
     try:
-        return key_gen[offset:end]
+        for start in range(offset, offset + size, MAX_PAGE_SIZE):
+            end = min(start + MAX_PAGE_SIZE, offset + size)
+            if ascending:
+                part = tuple(key_gen[start:end])
+            else:
+                first, last = -1 - start, -1 - end  # negative: from the end
+                part = tuple(key_gen[first:last:-1])
+            result += part
+            if len(part) < end - start:
+                break  # end of the catalog
+        return result
     except HTTPStatusError as exc:
         # fmt: off
         # logger.error("HTTPStatusError: %s", exc)
@@ -286,15 +351,11 @@ def get_tiled_slice(cat, offset, size, ascending=True):
 
 def QueryTimeSince(isotime):
     """Tiled client query: all runs since given date/time."""
-    from . import utils
-
     return tiled.queries.Key("time") >= utils.iso2ts(isotime)
 
 
 def QueryTimeUntil(isotime):
     """Tiled client query: all runs until given date/time."""
-    from . import utils
-
     return tiled.queries.Key("time") <= utils.iso2ts(isotime)
 
 
@@ -335,19 +396,27 @@ def get_tiled_runs(cat, since=None, until=None, text=[], text_case=[], **keys):
         List of full text searches.  Case sensitive.
     `keys` dict :
         Dictionary of metadata keys and values to be matched.
+
+    Queries are added in this order: the time range (most selective, usually
+    indexed), then the keys, then full text (case sensitive first).  Repeated
+    full text terms are searched only once.
     """
+    queries = []
     if since is not None:
-        cat = cat.search(QueryTimeSince(since))
+        queries.append(QueryTimeSince(since))
     if until is not None:
-        cat = cat.search(QueryTimeUntil(until))
+        queries.append(QueryTimeUntil(until))
 
     for k, v in keys.items():
-        cat = cat.search(tiled.queries.Key(k) == v)
+        queries.append(tiled.queries.Key(k) == v)
+
+    for v in dict.fromkeys(text_case):  # unique, in order
+        queries.append(tiled.queries.FullText(v, case_sensitive=True))
+    for v in dict.fromkeys(text):
+        queries.append(tiled.queries.FullText(v, case_sensitive=False))
 
-    for v in text:
-        cat = cat.search(tiled.queries.FullText(v, case_sensitive=False))
-    for v in text_case:
-        cat = cat.search(tiled.queries.FullText(v, case_sensitive=True))
+    for query in queries:
+        cat = cat.search(query)
     return cat
 
 
@@ -0,0 +1,47 @@
+import pytest
+
+SERVER_PAGE_LIMIT = 300  # tiled server rejects a larger page[limit]
+
+
+class SliceView:
+    """keys() or items() of a FakeCatalog: a request for each slice."""
+
+    def __init__(self, values, requests):
+        self.values = values
+        self.requests = requests
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # tiled client: page[limit] is the slice's length, as asked
+            limit = abs(index.stop - index.start)
+            if limit > SERVER_PAGE_LIMIT:
+                raise ValueError(f"server rejects page[limit]={limit}")
+            self.requests.append(limit)
+        return self.values[index]
+
+
+class FakeCatalog:
+    """Stand-in for a tiled catalog of runs: keys & items slice like tiled."""
+
+    def __init__(self, n):
+        self.uids = [f"uid{i:04d}" for i in range(n)]
+        self.requests = []  # page[limit] of each slice requested
+
+    def __len__(self):
+        return len(self.uids)
+
+    def add_runs(self, n):
+        """New runs, added at the end of the catalog."""
+        self.uids += [f"uid{i:04d}" for i in range(len(self), len(self) + n)]
+
+    def keys(self):
+        return SliceView(list(self.uids), self.requests)
+
+    def items(self):
+        return SliceView([(uid, {"uid": uid}) for uid in self.uids], self.requests)
+
+
+@pytest.fixture
+def fake_catalog():
+    """Return a function(n) that makes a fake catalog of n runs."""
+    return FakeCatalog
@@ -0,0 +1,114 @@
+import pytest
+from PyQt5 import QtCore
+
+from ..bluesky_runs_catalog_table_model import FETCH_SIZE
+from ..bluesky_runs_catalog_table_model import BRCTableModel
+
+
+class FakeRun:
+    """Stand-in for tapi.RunMetadata: only the metadata the table shows."""
+
+    def __init__(self, uid):
+        self.run_md = {
+            "start": {"uid": uid, "scan_id": int(uid[3:]), "time": 0},
+            "stop": {"exit_status": "success"},
+        }
+
+    def get_run_md(self, doc, key, default=None):
+        return (self.run_md.get(doc) or {}).get(key, default)
+
+
+def run_loader(uid):
+    return FakeRun(uid)
+
+
+def make_uids(first, n):
+    return [f"uid{i:04d}" for i in range(first, first + n)]
+
+
+def scan_ids(model):
+    """Scan ID shown in each row of the model."""
+    return [
+        model.data(model.index(row, 0), QtCore.Qt.DisplayRole)
+        for row in range(model.rowCount())
+    ]
+
+
+def fetch_all(model):
+    while model.canFetchMore():
+        model.fetchMore()
+
+
+@pytest.fixture
+def model(qtbot):
+    return BRCTableModel(None)
+
+
+@pytest.mark.parametrize("n", [0, 1, FETCH_SIZE, FETCH_SIZE + 1, 3 * FETCH_SIZE])
+def test_fetchMore(model, n):
+    model.setUidList(make_uids(0, n), run_loader)
+    assert model.rowCount() == min(n, FETCH_SIZE)
+
+    fetch_all(model)
+    assert model.rowCount() == n
+    assert scan_ids(model) == list(range(n))
+
+    model.fetchMore()  # nothing more to fetch
+    assert model.rowCount() == n
+
+
+@pytest.mark.parametrize(
+    "n1, n2",
+    [
+        [0, 10],  # empty to non-empty
+        [10, 0],  # non-empty to empty
+        [40, 10],  # page shrinks
+        [10, 40],  # page grows
+        [40, 40],
+    ],
+)
+def test_setUidList(model, n1, n2):
+    model.setUidList(make_uids(0, n1), run_loader)
+    fetch_all(model)
+    assert model.rowCount() == n1
+
+    model.setUidList(make_uids(100, n2), run_loader)
+    # Refills the rows shown now, in place (or the first rows of a new table).
+    assert model.rowCount() == (min(n1, n2, FETCH_SIZE) or min(n2, FETCH_SIZE))
+    assert scan_ids(model) == list(range(100, 100 + model.rowCount()))
+
+    fetch_all(model)
+    assert model.rowCount() == n2
+    assert scan_ids(model) == list(range(100, 100 + n2))
+    assert len(model.row_backgrounds) == n2
+
+
+def test_getMetadata(model):
+    uids = make_uids(0, 30)
+    model.setUidList(uids, run_loader)
+    run = model.getMetadata(3)
+    assert run.get_run_md("start", "uid") == uids[3]
+    assert run is model.runs[uids[3]]
+
+
+def test_loader_fails(model, qtbot):
+    """If the loader fails, the model is not changed."""
+
+    def bad_loader(uid):
+        if uid == "uid0030":
+            raise ValueError("no such run")
+        return FakeRun(uid)
+
+    model.setUidList(make_uids(0, 40), bad_loader)
+    assert model.rowCount() == FETCH_SIZE
+    with qtbot.assertNotEmitted(model.rowsAboutToBeInserted):
+        with pytest.raises(ValueError):
+            model.fetchMore()
+    assert model.rowCount() == FETCH_SIZE
+    assert scan_ids(model) == list(range(FETCH_SIZE))
+
+    with qtbot.assertNotEmitted(model.rowsAboutToBeRemoved):
+        with pytest.raises(ValueError):
+            model.setUidList(make_uids(20, 20), bad_loader)
+    assert model.rowCount() == FETCH_SIZE
+    assert scan_ids(model) == list(range(FETCH_SIZE))
@@ -0,0 +1,73 @@
+import pytest
+
+from ..bluesky_runs_catalog_table_view import request_length
+from ..bluesky_runs_catalog_table_view import request_page_items
+
+
+def page_uids(cat, offset, size):
+    """The uids on this page, counted from the start of the catalog."""
+    end = offset + size
+    return tuple(cat.uids[offset:end])
+
+
+@pytest.mark.parametrize(
+    "n, offset, size, other",
+    [
+        [95, 0, 10, (10, 10)],  # first half: this page & the next
+        [95, 40, 10, (50, 10)],
+        [95, 85, 10, (75, 10)],  # second half: the previous page & this one
+        [95, 50, 10, (40, 10)],
+        [95, 5, 10, (15, 10)],
+        [15, 5, 10, (0, 5)],  # the previous page is short
+        [7, 0, 7, None],  # only page
+        [0, 0, 0, None],  # no runs
+    ],
+)
+def test_request_page_items(fake_catalog, n, offset, size, other):
+    cat = fake_catalog(n)
+    pages = request_page_items(cat, n, offset, size)
+    expected = {(offset, size): page_uids(cat, offset, size)}
+    if other is not None:
+        expected[other] = page_uids(cat, *other)
+    assert {k: tuple(uid for uid, _ in v) for k, v in pages.items()} == expected
+
+
+@pytest.mark.parametrize("offset", [85, 75, 65, 50, 20])
+def test_request_page_items_new_runs(fake_catalog, offset):
+    # New runs since the catalog's length (total) was known.
+    total, size = 95, 10
+    cat = fake_catalog(total)
+    cat.add_runs(3)
+    pages = request_page_items(cat, total, offset, size)
+    for (page_offset, length), items in pages.items():
+        uids = tuple(uid for uid, _ in items)
+        assert uids == page_uids(cat, page_offset, length)
+    assert (offset, size) in pages
+
+
+@pytest.mark.parametrize(
+    "size, offset, pages",
+    [
+        [150, 0, [(0, 150), (150, 150)]],  # both pages in one response
+        [250, 0, [(0, 250)]],  # only this page: two would be too many
+        [250, 750, [(750, 250)]],
+        [1000, 0, [(0, 1000)]],
+    ],
+)
+def test_request_page_items_limit(fake_catalog, size, offset, pages):
+    total = 1000
+    cat = fake_catalog(total)
+    result = request_page_items(cat, total, offset, size)
+    assert sorted(result) == pages
+    assert max(cat.requests) <= 300
+    for (page_offset, length), items in result.items():
+        uids = tuple(uid for uid, _ in items)
+        assert uids == page_uids(cat, page_offset, length)
+
+
+@pytest.mark.parametrize(
+    "size, length",
+    [[0, 0], [10, 20], [150, 300], [151, 151], [250, 250], [1000, 1000]],
+)
+def test_request_length(size, length):
+    assert request_length(size) == length
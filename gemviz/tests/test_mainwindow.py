@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+from .. import mainwindow
+
+
+class FakeServer(dict):
+    """Catalogs by name.  Some can't be made into a client."""
+
+    def __getitem__(self, name):
+        catalog = super().__getitem__(name)
+        if isinstance(catalog, Exception):
+            raise catalog
+        return catalog
+
+    def items(self):
+        # Like tiled, make each client while iterating.
+        for name in self:
+            yield name, self[name]
+
+
+def catalog_with_spec(spec_name):
+    return SimpleNamespace(specs=[SimpleNamespace(name=spec_name, version="1")])
+
+
+def test_setCatalogs(qtbot, monkeypatch):
+    """Only Bluesky run catalogs are listed.  A bad catalog is skipped."""
+    # Do not show the catalog selected when the list is set.
+    monkeypatch.setattr(mainwindow.MainWindow, "setCatalog", lambda *args: None)
+    window = mainwindow.MainWindow()
+    qtbot.addWidget(window)
+
+    server = FakeServer(
+        good=catalog_with_spec("CatalogOfBlueskyRuns"),
+        bad=ValueError("unsupported structure family 'composite'"),
+        other=catalog_with_spec("SomethingElse"),
+        also_good=catalog_with_spec("CatalogOfBlueskyRuns"),
+    )
+    window.setServer("http://localhost:8020", server)
+
+    combo = window.catalogs
+    assert [combo.itemText(i) for i in range(combo.count())] == ["good", "also_good"]
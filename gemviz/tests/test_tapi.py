@@ -0,0 +1,62 @@
+import pytest
+
+from .. import tapi
+
+
+@pytest.mark.parametrize(
+    "n, offset, size, ascending, first, last",
+    [
+        [20, 0, 5, True, 0, 4],
+        [20, 15, 5, True, 15, 19],
+        [20, 18, 5, True, 18, 19],  # short slice at the end
+        [20, 0, 5, False, 19, 15],  # offset counts from the end
+        [20, 5, 5, False, 14, 10],
+        [20, 17, 5, False, 2, 0],  # short slice at the start
+        [3, 0, 5, False, 2, 0],
+    ],
+)
+def test_get_tiled_slice(fake_catalog, n, offset, size, ascending, first, last):
+    cat = fake_catalog(n)
+    uids = tapi.get_tiled_slice(cat, offset, size, ascending=ascending)
+    step = 1 if ascending else -1
+    assert uids == tuple(cat.uids[i] for i in range(first, last + step, step))
+
+    items = tapi.get_tiled_slice(cat, offset, size, ascending, items=True)
+    assert tuple(uid for uid, _ in items) == uids
+
+
+@pytest.mark.parametrize(
+    "n, offset, size, ascending, requests",
+    [
+        [1000, 0, 300, True, [300]],
+        [1000, 0, 1000, True, [300, 300, 300, 100]],
+        [1000, 0, 500, False, [300, 200]],
+        [300, 100, 500, False, [300]],  # stops at the start of the catalog
+    ],
+)
+def test_get_tiled_slice_parts(fake_catalog, n, offset, size, ascending, requests):
+    cat = fake_catalog(n)
+    uids = tapi.get_tiled_slice(cat, offset, size, ascending=ascending)
+    assert cat.requests == requests
+
+    expected = cat.uids if ascending else cat.uids[::-1]
+    end = offset + size
+    assert uids == tuple(expected[offset:end])
+
+
+@pytest.mark.parametrize(
+    "data_key, pv",
+    [
+        [{"source": "PV:ioc:m1"}, "ioc:m1"],
+        [{"source": "SIM:m1"}, ""],
+        [{"source": None}, ""],
+        [{"source": 5}, ""],
+        [{}, ""],
+    ],
+)
+def test_stream_data_field_pv(data_key, pv):
+    run = tapi.RunMetadata.__new__(tapi.RunMetadata)  # no server
+    descriptor = {"data_keys": {"m1": data_key}}
+    run.streams_md = {"primary": {"descriptors": [descriptor]}}
+    assert run.stream_data_field_pv("primary", "m1") == pv
+    assert run.stream_data_field_pv("primary", "other") == ""
@@ -1,4 +1,5 @@
 import datetime
+import time
 
 import pytest
 from PyQt5 import QtWidgets
@@ -54,6 +55,50 @@ def test_ts2dt(ts, dt):
     assert utils.ts2dt(ts + ts_offset) == dt
 
 
+@pytest.mark.parametrize(
+    "timestamps",
+    [
+        [],
+        [1_707_052_455],
+        [1_707_052_455.25, 1_707_052_456.5, 1_707_052_457.125],
+        [1_699_999_999.999_999, 1_720_000_000],  # maybe different UTC offsets
+    ],
+)
+def test_ts2dt64(timestamps):
+    dt64 = utils.ts2dt64(timestamps)
+    assert len(dt64) == len(timestamps)
+    assert dt64.tolist() == [utils.ts2dt(ts) for ts in timestamps]
+
+
+@pytest.fixture
+def chicago_time(monkeypatch):
+    """Local time of America/Chicago (its rule): daylight saving time."""
+    monkeypatch.setenv("TZ", "CST6CDT,M3.2.0,M11.1.0")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.parametrize(
+    "timestamps",
+    [
+        # fmt: off
+        [1_710_057_599.5, 1_710_057_600],  # DST starts: 2024-03-10 08:00 UTC
+        [1_730_617_199, 1_730_617_200.25],  # DST ends: 2024-11-03 07:00 UTC
+        [1_707_052_455, 1_720_000_000, 1_733_000_000],  # Feb, Jul, Dec
+        # Feb, Dec, Jul: not sorted
+        [1_707_052_455, 1_733_000_000, 1_720_000_000],
+        # fmt: on
+    ],
+)
+def test_ts2dt64_dst(chicago_time, timestamps):
+    dt64 = utils.ts2dt64(timestamps)
+    assert dt64.tolist() == [utils.ts2dt(ts) for ts in timestamps]
+    # Each set of times has both UTC offsets, standard & daylight saving.
+    assert len({time.localtime(ts).tm_gmtoff for ts in timestamps}) == 2
+
+
 @pytest.mark.parametrize(
     "ts, iso",
     [
@@ -68,6 +113,21 @@ def test_ts2iso(ts, iso):
     assert utils.ts2iso(ts + ts_offset) == iso
 
 
+@pytest.mark.parametrize(
+    "keys, size, kept",
+    [
+        ["abcde", 3, "cde"],  # least-recently used first
+        ["abc", 3, "abc"],
+        ["abc", 0, ""],
+        ["", 2, ""],
+    ],
+)
+def test_trim_cache(keys, size, kept):
+    cache = {k: i for i, k in enumerate(keys)}
+    utils.trim_cache(cache, size)
+    assert "".join(cache) == kept
+
+
 @pytest.mark.parametrize(
     "fname, uiname",
     [
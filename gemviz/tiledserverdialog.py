@@ -7,6 +7,13 @@ TILED_SERVER_SETTINGS_KEY = "tiled_server"
 # TODO: remove testing URLs before production:
 LOCALHOST_URL = "http://localhost:8020"
 TESTING_URL = "http://otz.xray.aps.anl.gov:8020"
+LOCALHOST_ID, RECENT_ID, OTHER_ID = range(3)  # server_buttons ids
+
+
+def getRecentServers():
+    """Return the list of recently-used tiled server URIs (from settings)."""
+    recent_servers_str = settings.getKey(TILED_SERVER_SETTINGS_KEY)
+    return recent_servers_str.split(",") if recent_servers_str else []
 
 
 class TiledServerDialog(QtWidgets.QDialog):
@@ -26,6 +33,12 @@ class TiledServerDialog(QtWidgets.QDialog):
         self.setModal(True)
         self.other_button.toggled.connect(self.enableOther)
 
+        # Qt reports which (exclusive) button is checked, by id.
+        self.server_buttons = QtWidgets.QButtonGroup(self)
+        self.server_buttons.addButton(self.localhost_button, LOCALHOST_ID)
+        self.server_buttons.addButton(self.url_button, RECENT_ID)
+        self.server_buttons.addButton(self.other_button, OTHER_ID)
+
     def enableOther(self):
         self.other_url.setEnabled(self.other_button.isChecked())
 
@@ -36,8 +49,7 @@ class TiledServerDialog(QtWidgets.QDialog):
     @staticmethod
     def getServer(parent):
         dialog = TiledServerDialog(parent)
-        recent_servers_str = settings.getKey(TILED_SERVER_SETTINGS_KEY)
-        recent_servers = recent_servers_str.split(",") if recent_servers_str else []
+        recent_servers = getRecentServers()
         server = recent_servers[0] if recent_servers else ""
         if server != "":
             dialog.url_button.setText(server)
@@ -46,25 +58,18 @@ class TiledServerDialog(QtWidgets.QDialog):
             dialog.url_button.setEnabled(False)
             dialog.localhost_button.setChecked(True)
 
-        choices = {
-            dialog.localhost_button: LOCALHOST_URL,
-            dialog.url_button: server,
-        }
-
         parent.setStatus("Choose which tiled server to use ...")
         ok_selected = dialog.exec()
 
-        selected = None
         if not ok_selected:
             return
-        for button, server in choices.items():
-            if button.isChecked():
-                selected = server
-                break
-        if selected is None and dialog.other_button.isChecked():
-            selected = dialog.other_url.text()
-
-        return selected
+        choices = {
+            LOCALHOST_ID: LOCALHOST_URL,
+            RECENT_ID: server,
+            OTHER_ID: dialog.other_url.text(),
+        }
+        # None if no button is checked (id: -1)
+        return choices.get(dialog.server_buttons.checkedId())
 
 
 # -----------------------------------------------------------------------------
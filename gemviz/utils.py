@@ -9,14 +9,20 @@ Support for GemViz.
     ~myLoadUi
     ~removeAllLayoutWidgets
     ~run_in_thread
+    ~trim_cache
     ~ts2dt
+    ~ts2dt64
     ~ts2iso
 """
 
 import datetime
+import functools
 import logging
 import pathlib
 import threading
+import time
+
+from PyQt5 import uic
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +49,29 @@ def ts2dt(timestamp):
     return datetime.datetime.fromtimestamp(timestamp)
 
 
+def ts2dt64(timestamps):
+    """
+    Convert an array of timestamps to numpy datetime64 (local time).
+
+    Same times as ``ts2dt()`` for each timestamp, computed for the whole
+    array at once.  The local time zone's UTC offset is found once for
+    each quarter hour with data.  Its changes (such as daylight saving
+    time) happen at the start of a quarter hour.
+    """
+    import numpy  # only for plots: not loaded when the app starts
+
+    ts = numpy.asarray(timestamps, dtype=float)
+    if ts.size == 0:
+        return ts.astype("datetime64[us]")
+    quarters, inverse = numpy.unique(ts // (15 * MINUTE), return_inverse=True)
+    offsets = numpy.array(
+        [time.localtime(q * 15 * MINUTE).tm_gmtoff for q in quarters],
+        dtype="int64",
+    )
+    utc = numpy.round(ts * 1e6).astype("int64").astype("datetime64[us]")
+    return utc + offsets[inverse].reshape(ts.shape).astype("timedelta64[s]")
+
+
 def ts2iso(timestamp):
     """Convert timestamp to ISO8601 time string."""
     return ts2dt(timestamp).isoformat(sep=" ")
@@ -73,6 +102,17 @@ def run_in_thread(func):
     return wrapper
 
 
+def trim_cache(cache, size):
+    """
+    Remove the least-recently used items from the cache (dict) above size.
+
+    The dict's order is least- to most-recently used: each time an item is
+    used, the caller pops it and inserts it again.
+    """
+    while len(cache) > size:
+        cache.pop(next(iter(cache)))
+
+
 def removeAllLayoutWidgets(layout):
     """Remove all existing widgets from QLayout."""
     for i in reversed(range(layout.count())):
@@ -92,17 +132,38 @@ def myLoadUi(ui_file, baseinstance=None, **kw):
     inspired by:
     http://stackoverflow.com/questions/14892713/how-do-you-load-ui-files-onto-python-classes-with-pyside?lq=1
     """
-    from PyQt5 import uic
+    if isinstance(ui_file, str):
+        ui_file = _uiFilePath(ui_file)
+
+    logger.debug("ui_file=%s", ui_file)
+    if baseinstance is None or len(kw) > 0:
+        return uic.loadUi(ui_file, baseinstance=baseinstance, **kw)
 
+    # Parse the .ui file only the first time.  Re-use the compiled form.
+    form = _uiFormClass(ui_file)()
+    form.setupUi(baseinstance)
+    # As uic.loadUi() does, make the widgets attributes of baseinstance.
+    for name, widget in vars(form).items():
+        setattr(baseinstance, name, widget)
+    return baseinstance
+
+
+@functools.lru_cache(maxsize=None)
+def _uiFilePath(ui_file):
+    """Full path of the .ui file in the resources directory.  Cached."""
     from . import UI_DIR
 
-    if isinstance(ui_file, str):
-        ui_file = UI_DIR / ui_file
+    return UI_DIR / ui_file
 
-    logger.debug("ui_file=%s", ui_file)
-    return uic.loadUi(ui_file, baseinstance=baseinstance, **kw)
+
+@functools.lru_cache(maxsize=None)
+def _uiFormClass(ui_file):
+    """Compile the .ui file into a form class.  Cached: once per file."""
+    form_class, _base_class = uic.loadUiType(str(ui_file))
+    return form_class
 
 
+@functools.lru_cache(maxsize=None)
 def getUiFileName(py_file_name):
     """UI file name matches the Python file, different extension."""
     return f"{pathlib.Path(py_file_name).stem}.ui"